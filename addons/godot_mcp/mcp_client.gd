@@ -99,7 +99,8 @@ func send_response(response: Dictionary) -> void:
 	var json_string = JSON.stringify(response, "\t")
 	print("[MCP Client] Sending: %s" % json_string)
 
-	var err = socket.send_text(json_string)
+	# Binary frame: the server parses the UTF-8 bytes directly
+	var err = socket.send(json_string.to_utf8_buffer())
 	if err != OK:
 		push_error("[MCP Client] Failed to send response: %d" % err)
 
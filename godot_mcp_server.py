@@ -6,32 +6,227 @@ A fully functional MCP server that receives commands, logs them, and returns suc
 
 import asyncio
 import websockets
+from websockets.asyncio.server import serve
 import json
 import logging
 import argparse
-from datetime import datetime
-from typing import Dict, Any, Optional
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('godot_mcp_server.log'),
-        logging.StreamHandler()
-    ]
-)
+import queue
+import signal
+import sys
+import weakref
+import msgspec
+from datetime import datetime, timezone
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Dict, Any, Optional, Tuple
+
+# orjson is an optional accelerator; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloop is an optional, faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+    def _json_loads(data):
+        """Parse a JSON str or bytes payload"""
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (indented only when asked, e.g. for logs)"""
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=options)
+else:
+    def _json_default(obj: Any) -> Any:
+        """Encode UTC datetimes the same way orjson does (with a 'Z' suffix)"""
+        if isinstance(obj, datetime):
+            return obj.isoformat().replace('+00:00', 'Z')
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    # Reused coder instances; json.dumps() builds a new encoder on every call with
+    # non-default options. Non-ASCII text (e.g. node names) is kept as-is, not \u-escaped.
+    _JSON_DECODE = json.JSONDecoder().decode
+    _JSON_ENCODE = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_json_default).encode
+    _JSON_ENCODE_INDENTED = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default).encode
+
+    def _json_loads(data):
+        """Parse a JSON str or bytes payload"""
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode()
+        return _JSON_DECODE(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (indented only when asked, e.g. for logs)"""
+        if indent:
+            return _JSON_ENCODE_INDENTED(obj).encode()
+        return _JSON_ENCODE(obj).encode()
+
+
+def _json_pretty(obj: Any) -> str:
+    """Indented JSON text for log output"""
+    return _json_dumps(obj, indent=True).decode()
+
+
+# WebSocket subprotocols offered to clients; a client that asks for neither gets JSON
+MSGPACK_SUBPROTOCOL = 'mcp.msgpack'
+JSON_SUBPROTOCOL = 'mcp.json'
+
+
+def _select_subprotocol(connection, subprotocols):
+    """Pick MessagePack when the client offers it; clients offering nothing we know get plain JSON"""
+    for subprotocol in (MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL):
+        if subprotocol in subprotocols:
+            return subprotocol
+    return None
+
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+
+
+# ========== MCP Command Parameters ==========
+# Typed parameters per command; a request's params object is validated and
+# converted in one msgspec call instead of a params.get() per field.
+
+class GetProjectInfoParams(msgspec.Struct):
+    pass
+
+
+class GetFileContentParams(msgspec.Struct):
+    file_path: str = ''
+
+
+class SetFileContentParams(msgspec.Struct):
+    file_path: str = ''
+    content: str = ''
+
+
+class GetSceneNodesParams(msgspec.Struct):
+    scene_path: str = ''
+
+
+class AddNodeParams(msgspec.Struct):
+    parent_path: str = ''
+    node_type: str = ''
+    node_name: str = ''
+
+
+class RemoveNodeParams(msgspec.Struct):
+    node_path: str = ''
+
+
+class GetNodePropertyParams(msgspec.Struct):
+    node_path: str = ''
+    property_name: str = ''
+
+
+class SetNodePropertyParams(msgspec.Struct):
+    node_path: str = ''
+    property_name: str = ''
+    property_value: Any = None
+
+
+class FindAllFilesByTypeParams(msgspec.Struct):
+    file_type: str = ''
+    search_path: str = ''
+
+
+class RunToolMethodParams(msgspec.Struct):
+    method_name: str = ''
+    method_params: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+_PARAM_TYPES = {
+    'GetProjectInfo': GetProjectInfoParams,
+    'GetFileContent': GetFileContentParams,
+    'SetFileContent': SetFileContentParams,
+    'GetSceneNodes': GetSceneNodesParams,
+    'AddNode': AddNodeParams,
+    'RemoveNode': RemoveNodeParams,
+    'GetNodeProperty': GetNodePropertyParams,
+    'SetNodeProperty': SetNodePropertyParams,
+    'FindAllFilesByType': FindAllFilesByTypeParams,
+    'RunToolMethod': RunToolMethodParams,
+}
+
+
 logger = logging.getLogger('GodotMCPServer')
 
 
+def _default_client(record: logging.LogRecord) -> bool:
+    """Fill in the client field for records logged outside a client connection"""
+    if not hasattr(record, 'client'):
+        record.client = '-'
+    return True
+
+
+def configure_logging() -> Tuple[QueueListener, MemoryHandler]:
+    """Configure logging so file and console output are written by a background thread
+
+    Returns the queue listener and the buffered file handler; stop the listener
+    and then close the handler on shutdown so no buffered records are lost.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(client)s] %(message)s')
+
+    file_handler = logging.FileHandler('godot_mcp_server.log', delay=True)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    # The log file is written in chunks of 100 records; errors are flushed right away
+    buffered_file_handler = MemoryHandler(100, flushLevel=logging.ERROR, target=file_handler)
+
+    # Coroutines only enqueue records; the listener thread does the actual I/O
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_default_client)
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[queue_handler])
+
+    listener = QueueListener(log_queue, buffered_file_handler, console_handler)
+    listener.start()
+    return listener, buffered_file_handler
+
+
 class GodotMCPServer:
     """Main MCP Server class handling WebSocket connections and MCP commands"""
 
+    __slots__ = ('host', 'port', 'connected_clients', 'command_handlers', '_dispatch', '_ts_cache')
+
+    # Static part of each command's response data, built once and overlaid per request.
+    # Responses are only read by the encoders, so the templates are never mutated.
+    _RESPONSE_TEMPLATES = {
+        'GetProjectInfo': {
+            'command': 'GetProjectInfo',
+            'project_name': 'GodotMCPProject',
+            'godot_version': '4.5',
+            'project_path': '/path/to/project',
+            'message': 'Project info retrieved successfully'
+        },
+        'GetFileContent': {'command': 'GetFileContent', 'content': ''},
+        'SetFileContent': {'command': 'SetFileContent'},
+        'GetSceneNodes': {'command': 'GetSceneNodes', 'nodes': ()},
+        'AddNode': {'command': 'AddNode'},
+        'RemoveNode': {'command': 'RemoveNode'},
+        'GetNodeProperty': {'command': 'GetNodeProperty', 'property_value': None},
+        'SetNodeProperty': {'command': 'SetNodeProperty'},
+        'FindAllFilesByType': {'command': 'FindAllFilesByType', 'files': ()},
+        'RunToolMethod': {'command': 'RunToolMethod', 'result': None},
+    }
+
     def __init__(self, host: str = "localhost", port: int = 8765):
         self.host = host
         self.port = port
-        self.connected_clients = set()
+        # Outgoing frame queue per connected websocket; each queue is drained by
+        # a single writer task, so senders never write to the socket directly.
+        # Weak keys let a connection be reclaimed even if a code path skips removal.
+        self.connected_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
         # Map of supported MCP commands to their handlers
         self.command_handlers = {
@@ -46,70 +241,180 @@ class GodotMCPServer:
             'FindAllFilesByType': self.handle_find_all_files_by_type,
             'RunToolMethod': self.handle_run_tool_method,
         }
+        # Dispatch table with interned keys, built once for single-lookup dispatch
+        # of both the handler and its parameter type
+        self._dispatch = {
+            sys.intern(name): (handler, _PARAM_TYPES[name])
+            for name, handler in self.command_handlers.items()
+        }
+        # Response timestamp shared by everything answered in the same event-loop iteration
+        self._ts_cache: Optional[datetime] = None
 
-    async def handle_client(self, websocket, path):
+    async def handle_client(self, websocket):
         """Handle incoming WebSocket client connections"""
         client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        self.connected_clients.add(websocket)
-        logger.info(f"New client connected: {client_id}")
+        # Per-connection logger; the client id is added by the log format, not per message
+        client_logger = logging.LoggerAdapter(logger, {'client': client_id})
+        in_queue = asyncio.Queue(maxsize=256)
+        out_queue = asyncio.Queue(maxsize=256)
+        worker = asyncio.create_task(self.process_client(websocket, in_queue, out_queue, client_logger))
+        writer = asyncio.create_task(self.write_client(websocket, out_queue))
+        self.connected_clients[websocket] = out_queue
+        client_logger.info("New client connected (protocol: %s)", websocket.subprotocol or JSON_SUBPROTOCOL)
 
         try:
-            async for message in websocket:
-                await self.process_message(websocket, message, client_id)
+            while True:
+                # Read raw payload bytes: the JSON/MessagePack parsers check UTF-8
+                # themselves, so the library's str decoding of text frames is skipped
+                message = await websocket.recv(decode=False)
+                await in_queue.put(message)
         except websockets.exceptions.ConnectionClosed:
-            logger.info(f"Client disconnected: {client_id}")
+            client_logger.info("Client disconnected")
         except Exception as e:
-            logger.error(f"Error handling client {client_id}: {e}", exc_info=True)
+            client_logger.error("Error handling client: %s", e, exc_info=True)
         finally:
-            self.connected_clients.discard(websocket)
+            worker.cancel()
+            writer.cancel()
+            self.connected_clients.pop(websocket, None)
+
+    async def process_client(self, websocket, in_queue: asyncio.Queue, out_queue: asyncio.Queue,
+                             client_logger: logging.LoggerAdapter):
+        """Process a client's queued messages, running each burst of requests concurrently"""
+        while True:
+            messages = [await in_queue.get()]
+            while not in_queue.empty():
+                messages.append(in_queue.get_nowait())
+
+            if len(messages) == 1:
+                frames = [await self.process_message(websocket, messages[0], client_logger)]
+            else:
+                frames = await asyncio.gather(
+                    *(self.process_message(websocket, message, client_logger) for message in messages)
+                )
+
+            # Responses are queued in request order
+            for frame in frames:
+                await out_queue.put(frame)
 
-    async def process_message(self, websocket, message: str, client_id: str):
-        """Process incoming MCP message"""
+    async def write_client(self, websocket, out_queue: asyncio.Queue):
+        """Send queued frames to a client; the only task that writes to its socket"""
         try:
-            # Parse JSON request
-            request = json.loads(message)
-            logger.info(f"Received from {client_id}: {json.dumps(request, indent=2)}")
-
-            # Extract command and parameters
-            command = request.get('command')
-            params = request.get('params', {})
-            request_id = request.get('id')
-
-            if not command:
-                response = self.create_error_response(
-                    request_id,
-                    "Missing 'command' field in request"
-                )
-            elif command not in self.command_handlers:
-                response = self.create_error_response(
-                    request_id,
-                    f"Unknown command: {command}"
-                )
-            else:
-                # Execute command handler
-                handler = self.command_handlers[command]
-                response = await handler(params, request_id)
+            while True:
+                await websocket.send(await out_queue.get())
+        except websockets.exceptions.ConnectionClosed:
+            pass
 
-            # Send response
-            response_json = json.dumps(response, indent=2)
-            logger.info(f"Sending to {client_id}: {response_json}")
-            await websocket.send(response_json)
+    async def process_message(self, websocket, message: bytes, client_logger: logging.LoggerAdapter) -> bytes:
+        """Process incoming MCP message and return the encoded response frame"""
+        # MessagePack can carry values JSON cannot (bin, non-str keys), so its
+        # traffic is logged with repr() rather than re-encoded as JSON
+        if websocket.subprotocol == MSGPACK_SUBPROTOCOL:
+            loads, dumps, describe = _MSGPACK_DECODER.decode, _MSGPACK_ENCODER.encode, repr
+        else:
+            loads, dumps, describe = _json_loads, _json_dumps, _json_pretty
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from {client_id}: {e}")
+        try:
+            # Parse request in the negotiated wire format
+            request = loads(message)
+            if client_logger.isEnabledFor(logging.INFO):
+                client_logger.info("Received: %s", describe(request))
+
+            if isinstance(request, dict) and 'batch' in request and 'command' not in request:
+                # Batch envelope: run every request concurrently, answer in one frame
+                batch = request['batch']
+                if isinstance(batch, list):
+                    responses = await asyncio.gather(*(self.handle_batch_item(item, client_logger) for item in batch))
+                    response = {'batch': responses}
+                else:
+                    response = self.create_error_response(request.get('id'), "'batch' must be a list of requests")
+            else:
+                response = await self.handle_request(request, client_logger)
+
+            # The encoders return bytes, which go out as a binary frame without a
+            # str -> UTF-8 copy; only the log path produces text
+            wire = dumps(response)
+            if client_logger.isEnabledFor(logging.INFO):
+                client_logger.info("Sending: %s", describe(response))
+            return wire
+
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # The stdlib fallback decodes bytes before parsing, so bad UTF-8
+            # surfaces as UnicodeDecodeError rather than JSONDecodeError
+            client_logger.error("Invalid JSON: %s", e)
             error_response = self.create_error_response(None, f"Invalid JSON: {e}")
-            await websocket.send(json.dumps(error_response))
+            return dumps(error_response)
+        except msgspec.DecodeError as e:
+            client_logger.error("Invalid MessagePack: %s", e)
+            error_response = self.create_error_response(None, f"Invalid MessagePack: {e}")
+            return dumps(error_response)
         except Exception as e:
-            logger.error(f"Error processing message from {client_id}: {e}", exc_info=True)
+            client_logger.error("Error processing message: %s", e, exc_info=True)
             error_response = self.create_error_response(None, f"Internal error: {e}")
-            await websocket.send(json.dumps(error_response))
+            return dumps(error_response)
+
+    async def handle_batch_item(self, request: Dict[str, Any], client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
+        """Handle one batch entry; an unexpected error fails only that entry"""
+        try:
+            return await self.handle_request(request, client_logger)
+        except Exception as e:
+            client_logger.error("Error processing batch request: %s", e, exc_info=True)
+            request_id = request.get('id') if isinstance(request, dict) else None
+            return self.create_error_response(request_id, f"Internal error: {e}")
+
+    async def handle_request(self, request: Dict[str, Any], client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
+        """Dispatch a single decoded request to its command handler"""
+        if not isinstance(request, dict):
+            return self.create_error_response(None, "Request must be an object")
+
+        # Extract command and parameters
+        command = request.get('command')
+        params = request.get('params', {})
+        request_id = request.get('id')
+
+        if not command:
+            return self.create_error_response(
+                request_id,
+                "Missing 'command' field in request"
+            )
+        elif not isinstance(command, str):
+            return self.create_error_response(
+                request_id,
+                "'command' must be a string"
+            )
+
+        entry = self._dispatch.get(command)
+        if entry is None:
+            return self.create_error_response(
+                request_id,
+                f"Unknown command: {command}"
+            )
+
+        handler, params_type = entry
+        try:
+            typed_params = msgspec.convert(params, params_type)
+        except msgspec.ValidationError as e:
+            return self.create_error_response(request_id, f"Invalid params: {e}")
+
+        # Execute command handler
+        return await handler(typed_params, request_id, client_logger)
+
+    def _now(self) -> datetime:
+        """Return the current UTC time, read at most once per event-loop iteration"""
+        if self._ts_cache is None:
+            self._ts_cache = datetime.now(timezone.utc)
+            asyncio.get_running_loop().call_soon(self._expire_timestamp)
+        return self._ts_cache
+
+    def _expire_timestamp(self):
+        """Drop the cached timestamp once the current loop iteration is done"""
+        self._ts_cache = None
 
     def create_success_response(self, request_id: Optional[str], data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a success response"""
         return {
             'id': request_id,
             'status': 'success',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._now(),
             'data': data
         }
 
@@ -118,70 +423,68 @@ class GodotMCPServer:
         return {
             'id': request_id,
             'status': 'error',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._now(),
             'error': error_message
         }
 
     # ========== MCP Command Handlers ==========
 
-    async def handle_get_project_info(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_get_project_info(self, params: GetProjectInfoParams, request_id: str,
+                                      client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle GetProjectInfo command"""
-        logger.info(f"[GetProjectInfo] Parameters: {params}")
+        client_logger.info("[GetProjectInfo] Parameters: %s", params)
 
-        return self.create_success_response(request_id, {
-            'command': 'GetProjectInfo',
-            'project_name': 'GodotMCPProject',
-            'godot_version': '4.5',
-            'project_path': '/path/to/project',
-            'message': 'Project info retrieved successfully'
-        })
+        # Fully static payload: the shared template is sent as-is
+        return self.create_success_response(request_id, self._RESPONSE_TEMPLATES['GetProjectInfo'])
 
-    async def handle_get_file_content(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_get_file_content(self, params: GetFileContentParams, request_id: str,
+                                      client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle GetFileContent command"""
-        file_path = params.get('file_path', '')
-        logger.info(f"[GetFileContent] File: {file_path}")
+        file_path = params.file_path
+        client_logger.info("[GetFileContent] File: %s", file_path)
 
         return self.create_success_response(request_id, {
-            'command': 'GetFileContent',
+            **self._RESPONSE_TEMPLATES['GetFileContent'],
             'file_path': file_path,
-            'content': '',
             'message': f'File content retrieved for: {file_path}'
         })
 
-    async def handle_set_file_content(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_set_file_content(self, params: SetFileContentParams, request_id: str,
+                                      client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle SetFileContent command"""
-        file_path = params.get('file_path', '')
-        content = params.get('content', '')
-        logger.info(f"[SetFileContent] File: {file_path}, Content length: {len(content)}")
+        file_path = params.file_path
+        content = params.content
+        client_logger.info("[SetFileContent] File: %s, Content length: %d", file_path, len(content))
 
         return self.create_success_response(request_id, {
-            'command': 'SetFileContent',
+            **self._RESPONSE_TEMPLATES['SetFileContent'],
             'file_path': file_path,
             'bytes_written': len(content),
             'message': f'File content set successfully for: {file_path}'
         })
 
-    async def handle_get_scene_nodes(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_get_scene_nodes(self, params: GetSceneNodesParams, request_id: str,
+                                     client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle GetSceneNodes command"""
-        scene_path = params.get('scene_path', '')
-        logger.info(f"[GetSceneNodes] Scene: {scene_path}")
+        scene_path = params.scene_path
+        client_logger.info("[GetSceneNodes] Scene: %s", scene_path)
 
         return self.create_success_response(request_id, {
-            'command': 'GetSceneNodes',
+            **self._RESPONSE_TEMPLATES['GetSceneNodes'],
             'scene_path': scene_path,
-            'nodes': [],
             'message': f'Scene nodes retrieved for: {scene_path}'
         })
 
-    async def handle_add_node(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_add_node(self, params: AddNodeParams, request_id: str,
+                              client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle AddNode command"""
-        parent_path = params.get('parent_path', '')
-        node_type = params.get('node_type', '')
-        node_name = params.get('node_name', '')
-        logger.info(f"[AddNode] Parent: {parent_path}, Type: {node_type}, Name: {node_name}")
+        parent_path = params.parent_path
+        node_type = params.node_type
+        node_name = params.node_name
+        client_logger.info("[AddNode] Parent: %s, Type: %s, Name: %s", parent_path, node_type, node_name)
 
         return self.create_success_response(request_id, {
-            'command': 'AddNode',
+            **self._RESPONSE_TEMPLATES['AddNode'],
             'parent_path': parent_path,
             'node_type': node_type,
             'node_name': node_name,
@@ -189,70 +492,72 @@ class GodotMCPServer:
             'message': f'Node {node_name} added successfully'
         })
 
-    async def handle_remove_node(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_remove_node(self, params: RemoveNodeParams, request_id: str,
+                                 client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle RemoveNode command"""
-        node_path = params.get('node_path', '')
-        logger.info(f"[RemoveNode] Node: {node_path}")
+        node_path = params.node_path
+        client_logger.info("[RemoveNode] Node: %s", node_path)
 
         return self.create_success_response(request_id, {
-            'command': 'RemoveNode',
+            **self._RESPONSE_TEMPLATES['RemoveNode'],
             'node_path': node_path,
             'message': f'Node {node_path} removed successfully'
         })
 
-    async def handle_get_node_property(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_get_node_property(self, params: GetNodePropertyParams, request_id: str,
+                                       client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle GetNodeProperty command"""
-        node_path = params.get('node_path', '')
-        property_name = params.get('property_name', '')
-        logger.info(f"[GetNodeProperty] Node: {node_path}, Property: {property_name}")
+        node_path = params.node_path
+        property_name = params.property_name
+        client_logger.info("[GetNodeProperty] Node: %s, Property: %s", node_path, property_name)
 
         return self.create_success_response(request_id, {
-            'command': 'GetNodeProperty',
+            **self._RESPONSE_TEMPLATES['GetNodeProperty'],
             'node_path': node_path,
             'property_name': property_name,
-            'property_value': None,
             'message': f'Property {property_name} retrieved for node {node_path}'
         })
 
-    async def handle_set_node_property(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_set_node_property(self, params: SetNodePropertyParams, request_id: str,
+                                       client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle SetNodeProperty command"""
-        node_path = params.get('node_path', '')
-        property_name = params.get('property_name', '')
-        property_value = params.get('property_value')
-        logger.info(f"[SetNodeProperty] Node: {node_path}, Property: {property_name}, Value: {property_value}")
+        node_path = params.node_path
+        property_name = params.property_name
+        property_value = params.property_value
+        client_logger.info("[SetNodeProperty] Node: %s, Property: %s, Value: %s", node_path, property_name, property_value)
 
         return self.create_success_response(request_id, {
-            'command': 'SetNodeProperty',
+            **self._RESPONSE_TEMPLATES['SetNodeProperty'],
             'node_path': node_path,
             'property_name': property_name,
             'property_value': property_value,
             'message': f'Property {property_name} set successfully for node {node_path}'
         })
 
-    async def handle_find_all_files_by_type(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_find_all_files_by_type(self, params: FindAllFilesByTypeParams, request_id: str,
+                                            client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle FindAllFilesByType command"""
-        file_type = params.get('file_type', '')
-        search_path = params.get('search_path', '')
-        logger.info(f"[FindAllFilesByType] Type: {file_type}, Path: {search_path}")
+        file_type = params.file_type
+        search_path = params.search_path
+        client_logger.info("[FindAllFilesByType] Type: %s, Path: %s", file_type, search_path)
 
         return self.create_success_response(request_id, {
-            'command': 'FindAllFilesByType',
+            **self._RESPONSE_TEMPLATES['FindAllFilesByType'],
             'file_type': file_type,
             'search_path': search_path,
-            'files': [],
             'message': f'Files of type {file_type} found in {search_path}'
         })
 
-    async def handle_run_tool_method(self, params: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    async def handle_run_tool_method(self, params: RunToolMethodParams, request_id: str,
+                                     client_logger: logging.LoggerAdapter) -> Dict[str, Any]:
         """Handle RunToolMethod command"""
-        method_name = params.get('method_name', '')
-        method_params = params.get('method_params', {})
-        logger.info(f"[RunToolMethod] Method: {method_name}, Params: {method_params}")
+        method_name = params.method_name
+        method_params = params.method_params
+        client_logger.info("[RunToolMethod] Method: %s, Params: %s", method_name, method_params)
 
         return self.create_success_response(request_id, {
-            'command': 'RunToolMethod',
+            **self._RESPONSE_TEMPLATES['RunToolMethod'],
             'method_name': method_name,
-            'result': None,
             'message': f'Tool method {method_name} executed successfully'
         })
 
@@ -260,7 +565,17 @@ class GodotMCPServer:
         """Start the WebSocket server"""
         logger.info(f"Starting Godot MCP Server on {self.host}:{self.port}")
 
-        async with websockets.serve(self.handle_client, self.host, self.port):
+        async with serve(
+            self.handle_client,
+            self.host,
+            self.port,
+            select_subprotocol=_select_subprotocol,
+            # MCP messages are small and frequent, so per-message deflate costs
+            # more CPU and latency than it saves in bandwidth. Payloads that are
+            # ever sent to many clients should be compressed once up front instead.
+            compression=None,
+            max_size=2**24,
+        ):
             logger.info(f"Server is running and listening on ws://{self.host}:{self.port}")
             await asyncio.Future()  # Run forever
 
@@ -292,19 +607,31 @@ def main():
 
     args = parser.parse_args()
 
+    # Set up logging and its background writer thread
+    log_listener, buffered_log_handler = configure_logging()
+
     # Set logging level
     logger.setLevel(getattr(logging, args.log_level))
 
     # Create and start server
     server = GodotMCPServer(host=args.host, port=args.port)
 
+    run = uvloop.run if uvloop is not None else asyncio.run
+
+    # Exit normally on SIGTERM so buffered log records are flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     try:
-        asyncio.run(server.start())
+        run(server.start())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
         logger.error(f"Server error: {e}", exc_info=True)
         raise
+    finally:
+        # Drain the queue, then write out whatever the file buffer still holds
+        log_listener.stop()
+        buffered_log_handler.close()
 
 
 if __name__ == '__main__':
@@ -32,7 +32,7 @@ fi
 
 # Check if requirements are installed
 echo -e "${YELLOW}[1/5] Checking dependencies...${NC}"
-if ! python3 -c "import websockets" 2>/dev/null; then
+if ! python3 -c "import websockets, msgspec" 2>/dev/null; then
     echo -e "${YELLOW}Installing dependencies...${NC}"
     pip install -r requirements.txt
 fi
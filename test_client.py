@@ -23,7 +23,50 @@ async def send_command(websocket, command, params, request_id):
     print(f"Parameters: {json.dumps(params, indent=2)}")
     print(f"{'='*60}")
 
-    await websocket.send(json.dumps(request))
+    await websocket.send(json.dumps(request).encode())
+
+    response = await websocket.recv()
+    response_data = json.loads(response)
+
+    print(f"\nResponse:")
+    print(json.dumps(response_data, indent=2))
+
+    return response_data
+
+
+async def send_pipelined(websocket, requests):
+    """Send all requests without waiting, then collect and print the responses"""
+    for request in requests:
+        print(f"\n{'='*60}")
+        print(f"Sending: {request['command']}")
+        print(f"Request ID: {request['id']}")
+        print(f"Parameters: {json.dumps(request['params'], indent=2)}")
+        print(f"{'='*60}")
+
+    async def producer():
+        for request in requests:
+            await websocket.send(json.dumps(request).encode())
+
+    async def consumer():
+        return [json.loads(await websocket.recv()) for _ in requests]
+
+    # Sending and receiving overlap, so N commands cost about one round trip
+    _, responses = await asyncio.gather(producer(), consumer())
+
+    for response_data in responses:
+        print(f"\nResponse ({response_data['id']}):")
+        print(json.dumps(response_data, indent=2))
+
+    return responses
+
+
+async def send_batch(websocket, requests):
+    """Send several commands in one batch envelope and print the combined response"""
+    print(f"\n{'='*60}")
+    print(f"Sending batch of {len(requests)} commands")
+    print(f"{'='*60}")
+
+    await websocket.send(json.dumps({'batch': requests}).encode())
 
     response = await websocket.recv()
     response_data = json.loads(response)
@@ -43,105 +86,79 @@ async def test_all_commands():
     async with websockets.connect(uri) as websocket:
         print("Connected successfully!\n")
 
-        # Test 1: GetProjectInfo
-        await send_command(
-            websocket,
-            'GetProjectInfo',
-            {},
-            'test-001'
-        )
-
-        # Test 2: GetFileContent
-        await send_command(
-            websocket,
-            'GetFileContent',
-            {'file_path': 'res://scripts/player.gd'},
-            'test-002'
-        )
-
-        # Test 3: SetFileContent
-        await send_command(
-            websocket,
-            'SetFileContent',
+        # Tests 1-10: every command, pipelined over the same connection
+        await send_pipelined(websocket, [
             {
-                'file_path': 'res://scripts/player.gd',
-                'content': 'extends CharacterBody2D\n\nfunc _ready():\n\tpass\n'
+                'id': 'test-001',
+                'command': 'GetProjectInfo',
+                'params': {}
             },
-            'test-003'
-        )
-
-        # Test 4: GetSceneNodes
-        await send_command(
-            websocket,
-            'GetSceneNodes',
-            {'scene_path': 'res://scenes/main.tscn'},
-            'test-004'
-        )
-
-        # Test 5: AddNode
-        await send_command(
-            websocket,
-            'AddNode',
             {
-                'parent_path': 'Root',
-                'node_type': 'Sprite2D',
-                'node_name': 'PlayerSprite'
+                'id': 'test-002',
+                'command': 'GetFileContent',
+                'params': {'file_path': 'res://scripts/player.gd'}
             },
-            'test-005'
-        )
-
-        # Test 6: RemoveNode
-        await send_command(
-            websocket,
-            'RemoveNode',
-            {'node_path': 'Root/PlayerSprite'},
-            'test-006'
-        )
-
-        # Test 7: GetNodeProperty
-        await send_command(
-            websocket,
-            'GetNodeProperty',
             {
-                'node_path': 'Root/Player',
-                'property_name': 'position'
+                'id': 'test-003',
+                'command': 'SetFileContent',
+                'params': {
+                    'file_path': 'res://scripts/player.gd',
+                    'content': 'extends CharacterBody2D\n\nfunc _ready():\n\tpass\n'
+                }
             },
-            'test-007'
-        )
-
-        # Test 8: SetNodeProperty
-        await send_command(
-            websocket,
-            'SetNodeProperty',
             {
-                'node_path': 'Root/Player',
-                'property_name': 'position',
-                'property_value': {'x': 100, 'y': 200}
+                'id': 'test-004',
+                'command': 'GetSceneNodes',
+                'params': {'scene_path': 'res://scenes/main.tscn'}
             },
-            'test-008'
-        )
-
-        # Test 9: FindAllFilesByType
-        await send_command(
-            websocket,
-            'FindAllFilesByType',
             {
-                'file_type': 'gd',
-                'search_path': 'res://scripts'
+                'id': 'test-005',
+                'command': 'AddNode',
+                'params': {
+                    'parent_path': 'Root',
+                    'node_type': 'Sprite2D',
+                    'node_name': 'PlayerSprite'
+                }
             },
-            'test-009'
-        )
-
-        # Test 10: RunToolMethod
-        await send_command(
-            websocket,
-            'RunToolMethod',
             {
-                'method_name': 'build_project',
-                'method_params': {}
+                'id': 'test-006',
+                'command': 'RemoveNode',
+                'params': {'node_path': 'Root/PlayerSprite'}
             },
-            'test-010'
-        )
+            {
+                'id': 'test-007',
+                'command': 'GetNodeProperty',
+                'params': {
+                    'node_path': 'Root/Player',
+                    'property_name': 'position'
+                }
+            },
+            {
+                'id': 'test-008',
+                'command': 'SetNodeProperty',
+                'params': {
+                    'node_path': 'Root/Player',
+                    'property_name': 'position',
+                    'property_value': {'x': 100, 'y': 200}
+                }
+            },
+            {
+                'id': 'test-009',
+                'command': 'FindAllFilesByType',
+                'params': {
+                    'file_type': 'gd',
+                    'search_path': 'res://scripts'
+                }
+            },
+            {
+                'id': 'test-010',
+                'command': 'RunToolMethod',
+                'params': {
+                    'method_name': 'build_project',
+                    'method_params': {}
+                }
+            },
+        ])
 
         # Test error handling
         print(f"\n{'='*60}")
@@ -154,6 +171,16 @@ async def test_all_commands():
             'test-error'
         )
 
+        # Test batching - several commands answered in a single frame
+        await send_batch(
+            websocket,
+            [
+                {'id': 'test-batch-1', 'command': 'GetProjectInfo', 'params': {}},
+                {'id': 'test-batch-2', 'command': 'GetSceneNodes', 'params': {'scene_path': 'res://scenes/main.tscn'}},
+                {'id': 'test-batch-3', 'command': 'InvalidCommand', 'params': {}},
+            ]
+        )
+
         print("\n" + "="*60)
         print("All tests completed!")
         print("="*60)
@@ -23,14 +23,18 @@ def check_dependencies():
     """Check if required Python packages are installed"""
     print("\n🔍 Checking Python dependencies...")
 
-    try:
-        import websockets
-        print(f"  ✅ websockets {websockets.__version__} (installed)")
-        return True
-    except ImportError:
-        print("  ❌ websockets (NOT installed)")
+    all_ok = True
+    for package in ("websockets", "msgspec"):
+        try:
+            module = __import__(package)
+            print(f"  ✅ {package} {module.__version__} (installed)")
+        except ImportError:
+            print(f"  ❌ {package} (NOT installed)")
+            all_ok = False
+
+    if not all_ok:
         print("     Install with: pip install -r requirements.txt")
-        return False
+    return all_ok
 
 def check_files():
     """Check if all required files exist"""
@@ -62,12 +66,14 @@ def check_files():
     for category, files in required_files.items():
         print(f"\n  {category}:")
         for file in files:
-            if os.path.exists(file):
-                size = os.path.getsize(file)
-                print(f"    ✅ {file} ({size} bytes)")
-            else:
+            # One stat call gives both existence and size
+            try:
+                size = os.stat(file).st_size
+            except FileNotFoundError:
                 print(f"    ❌ {file} (MISSING)")
                 all_ok = False
+            else:
+                print(f"    ✅ {file} ({size} bytes)")
 
     return all_ok
 
@@ -109,28 +115,40 @@ def check_port():
     """Check if port 8765 is available"""
     print("\n🔍 Checking port availability...")
 
+    import errno
     import socket
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1)
-
     try:
-        result = sock.connect_ex(('localhost', 8765))
+        # The server binds every address "localhost" resolves to (IPv4 and IPv6)
+        addresses = socket.getaddrinfo('localhost', 8765, type=socket.SOCK_STREAM)
+    except Exception as e:
+        print(f"  ⚠️  Error checking port: {e}")
+        return True
 
-        if result == 0:
+    for family, sock_type, proto, _, address in addresses:
+        try:
+            sock = socket.socket(family, sock_type, proto)
+        except OSError:
+            # Address family not supported on this machine (e.g. IPv6 disabled)
+            continue
+
+        try:
+            # Match the server's bind options so ports in TIME_WAIT count as free
+            # (on Windows SO_REUSEADDR would also allow binding an active port)
+            if os.name != 'nt':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(address)
+        except OSError as e:
+            if e.errno in (errno.EADDRNOTAVAIL, errno.EAFNOSUPPORT):
+                continue
             print("  ⚠️  Port 8765 is already in use")
             print("     Stop the existing server or use --port to specify another port")
-            sock.close()
             return False
-        else:
-            print("  ✅ Port 8765 is available")
+        finally:
             sock.close()
-            return True
 
-    except Exception as e:
-        print(f"  ⚠️  Error checking port: {e}")
-        sock.close()
-        return True
+    print("  ✅ Port 8765 is available")
+    return True
 
 def print_summary(results):
     """Print summary and next steps"""